@@ -1,17 +1,43 @@
 import time
+import atexit
 import csv
 import os
 import re
+import zlib
+import queue
+import threading
 import difflib
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from datetime import datetime
 
 import numpy as np
-import cv2
-import pytesseract
 import mss
 import keyboard
 
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:  # optional; difflib fallback for fuzzy team matching
+    fuzz_process = None
+
+# Precompiled patterns for OCR text cleanup / box-score parsing
+_RE_NONALNUM = re.compile(r"[^A-Z0-9 ]")
+_RE_WS = re.compile(r"\s+")
+_RE_NUM3 = re.compile(r"\b\d{1,3}\b")
+_RE_NUM = re.compile(r"\b\d+\b")
+
+# One OpenMP thread per Tesseract call: the images are small, so intra-image threading
+# mostly adds scheduling contention. The cores go to OCRing the two score strips at
+# once instead (_SCORE_POOL). Must be set before tesserocr loads / tesseract spawns.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+# cv2 / pytesseract / PIL / tesserocr are imported on first OCR use (see _lazy_ocr);
+# they dominate cold-start time and nothing before the first grab needs them.
+cv2 = None
+pytesseract = None
+Image = None
+
 # -----------------------------
 # CONFIG
 # -----------------------------
@@ -19,6 +45,33 @@ import keyboard
 # End-screen keyword OCR region (your working region)
 OCR_REGION = {"top": 140, "left": 280, "width": 800, "height": 220}
 
+# OCR_REGION split into two overlapping bands. The banner is read first; the lower
+# band is only OCR'd when the banner alone is inconclusive.
+OCR_REGION_BANNER = {
+    "top": OCR_REGION["top"],
+    "left": OCR_REGION["left"],
+    "width": OCR_REGION["width"],
+    "height": OCR_REGION["height"] * 3 // 5,
+}
+OCR_REGION_STRIP = {
+    "top": OCR_REGION["top"] + OCR_REGION["height"] * 2 // 5,
+    "left": OCR_REGION["left"],
+    "width": OCR_REGION["width"],
+    "height": OCR_REGION["height"] * 3 // 5,
+}
+
+# Menu keywords are big block letters, so OCR a downscaled copy (Tesseract time scales with pixels)
+OCR_MENU_SCALE = 0.5
+OCR_FULLRES_AFTER_UNKNOWNS = 2  # fall back to full resolution after this many UNKNOWN reads in a row
+OCR_MENU_PSM = 6  # uniform block of text
+
+# Characters allowed in the box-score table (team names + numbers)
+SCORE_WHITELIST = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+# Run menu-OCR preprocessing through OpenCL (cv2.UMat). Only worth it with an idle iGPU;
+# on a frame this small the upload/download usually costs more than the CPU path.
+OCR_USE_OPENCL = False
+
 # Box Score: TEAM / TOTAL table region (tuned from your screenshot on the prior machine)
 # NOTE: If this machine has different scaling/window placement, this may need tuning.
 BOX_SCORE_REGION = {"top": 60, "left": 420, "width": 520, "height": 120}
@@ -40,7 +93,9 @@ BOX_SCORE_REGION_FALLBACK = {
 
 
 CHECK_INTERVAL = 5
+CHECK_INTERVAL_FAST = 1.0  # poll rate while confirming an end screen
 ENDSCREEN_CONFIRMATIONS = 3
+LOOP_TICK = 0.02      # main loop wake-up; bounds ESC latency between OCR polls
 INPUT_GAP = 0.30
 
 # Menu timing: hold direction(s) -> wait -> press X while held -> release X -> release direction(s)
@@ -48,6 +103,9 @@ MENU_DIR_HOLD_BEFORE_CONFIRM = 0.60
 MENU_CONFIRM_HOLD = 0.55
 MENU_RELEASE_AFTER = 0.25
 
+# Final stretch of every timed wait that is busy-waited on perf_counter (time.sleep does the rest)
+PRECISE_SLEEP_SPIN = 0.0015
+
 SETTLE_SHORT = 1.0
 SETTLE_LONG = 2.0
 
@@ -78,6 +136,13 @@ STICK_DOWN = "s"
 STICK_LEFT = "a"
 STICK_RIGHT = "d"
 
+# Set-1 scancodes for the keys above (used by the SendInput path on Windows)
+SCANCODES = {
+    "x": 0x2D, "c": 0x2E, "enter": 0x1C,
+    "r": 0x13, "t": 0x14,
+    "w": 0x11, "a": 0x1E, "s": 0x1F, "d": 0x20,
+}
+
 # -----------------------------
 # STATE MACHINE
 # -----------------------------
@@ -99,35 +164,192 @@ game_lock_until = 0.0
 stats_logged_this_game = False
 games_played = 0
 
-sct = mss.mss()
+# Set by the ESC hotkey; the main loop only has to read a flag
+stop_requested = threading.Event()
+
+# Per-thread handles (mss instance, tesserocr engines, scratch buffers) for the
+# OCR worker, the main thread and the box-score pool
+_tls = threading.local()
+
+# Primary + fallback box-score strips are grabbed and OCR'd side by side
+_SCORE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="score-ocr")
+
+# tesserocr module (optional). When present, each thread keeps persistent engines
+# instead of pytesseract spawning a process and reloading the model on every call.
+_tesserocr = None
+
+_ocr_loaded = False
+_ocr_load_lock = threading.Lock()
 
 # -----------------------------
 # OCR / CAPTURE
 # -----------------------------
 
-def grab_region(region):
-    return np.array(sct.grab(region))
+def _lazy_ocr():
+    """Import the OCR stack on first use."""
+    global cv2, pytesseract, Image, _tesserocr, _ocr_loaded
+    if _ocr_loaded:
+        return
+    with _ocr_load_lock:
+        if _ocr_loaded:
+            return
 
-def ocr_normalized(img_bgra: np.ndarray) -> str:
+        import cv2 as _cv2
+        import pytesseract as _pytesseract
+        from PIL import Image as _Image
+        cv2, pytesseract, Image = _cv2, _pytesseract, _Image
+
+        if OCR_USE_OPENCL:
+            cv2.ocl.setUseOpenCL(True)
+            if not cv2.ocl.haveOpenCL():
+                print("[OCR] OpenCL not available; cv2.UMat will run on the CPU")
+
+        try:
+            import tesserocr as _tesserocr_mod
+        except ImportError:  # optional; falls back to the pytesseract subprocess
+            pass
+        else:
+            _tesserocr = _tesserocr_mod
+
+        _ocr_loaded = True
+
+def _tess_api(psm, whitelist=None):
+    """This thread's persistent tesserocr engine for (psm, whitelist), or None."""
+    global _tesserocr
+    if _tesserocr is None:
+        return None
+
+    apis = getattr(_tls, "tess", None)
+    if apis is None:
+        apis = _tls.tess = {}
+
+    api = apis.get((psm, whitelist))
+    if api is None:
+        try:
+            api = _tesserocr.PyTessBaseAPI(psm=psm, oem=_tesserocr.OEM.DEFAULT)
+        except RuntimeError as e:
+            print("[OCR] tesserocr init failed, using pytesseract:", repr(e))
+            _tesserocr = None
+            return None
+        if whitelist:
+            api.SetVariable("tessedit_char_whitelist", whitelist)
+        apis[(psm, whitelist)] = api
+    return api
+
+def ocr_image(gray, psm, whitelist=None, binary=False):
+    """Tesseract a uint8 image via the persistent engine, or pytesseract as a fallback.
+
+    binary=True means the image is already 0/255; it is then passed as packed 1bpp
+    (MSB first, 1 = white) so Tesseract skips its own Otsu pass.
+    """
+    api = _tess_api(psm, whitelist)
+    if api is None:
+        config = f"--oem 3 --psm {psm}"
+        if whitelist:
+            config += f" -c tessedit_char_whitelist={whitelist}"
+        # pytesseract round-trips through a temp PNG; hand it a PIL image directly, and
+        # a 1-bit one when we can (smaller file, roughly half the encode time)
+        img = Image.fromarray(gray)
+        if binary:
+            img = img.convert("1", dither=Image.Dither.NONE)
+        return pytesseract.image_to_string(img, config=config)
+
+    h, w = gray.shape
+    if binary:
+        bits = np.packbits(gray, axis=1)
+        api.SetImageBytes(bits.tobytes(), w, h, 0, bits.shape[1])
+    else:
+        api.SetImageBytes(gray.tobytes(), w, h, 1, w)
+    return api.GetUTF8Text()
+
+def _scratch(name, shape):
+    """Reusable per-thread uint8 buffer so per-poll preprocessing doesn't hit the allocator.
+
+    One buffer per name; it's only reallocated when the requested shape changes.
+    """
+    bufs = getattr(_tls, "bufs", None)
+    if bufs is None:
+        bufs = _tls.bufs = {}
+    buf = bufs.get(name)
+    if buf is None or buf.shape != shape:
+        buf = bufs[name] = np.empty(shape, dtype=np.uint8)
+    return buf
+
+def _resize_into(name, gray, scale, interpolation):
+    """cv2.resize by `scale` into a reusable scratch buffer."""
+    h, w = gray.shape[:2]
+    size = (round(w * scale), round(h * scale))
+    dst = _scratch(name, (size[1], size[0]) + gray.shape[2:])
+    return cv2.resize(gray, size, dst=dst, interpolation=interpolation)
+
+def _binarize(name, img_bgra, thresh):
+    """BGRA -> gray -> 0/255 in one scratch buffer (threshold runs in place)."""
+    gray = cv2.cvtColor(img_bgra, cv2.COLOR_BGRA2GRAY, dst=_scratch(name, img_bgra.shape[:2]))
+    return cv2.threshold(gray, thresh, 255, cv2.THRESH_BINARY, dst=gray)[1]
+
+def _crop_to_ink(binary, pad=4):
+    """Trim a thresholded image to the bounding box of its white pixels (+pad)."""
+    coords = cv2.findNonZero(binary)
+    if coords is None:
+        return binary
+    x, y, w, h = cv2.boundingRect(coords)
+    H, W = binary.shape[:2]
+    return binary[max(0, y - pad):min(H, y + h + pad), max(0, x - pad):min(W, x + w + pad)]
+
+def _text_rows(img, min_height=8, pad=4):
+    """(y0, y1) bands of rows containing ink, from a horizontal projection (+pad)."""
+    ink = np.count_nonzero(img, axis=1) > 1
+    edges = np.flatnonzero(np.diff(ink.view(np.int8), prepend=0, append=0))
+    h = img.shape[0]
+    return [
+        (max(0, y0 - pad), min(h, y1 + pad))
+        for y0, y1 in zip(edges[::2], edges[1::2])
+        if y1 - y0 >= min_height
+    ]
+
+def _sct():
+    sct = getattr(_tls, "sct", None)
+    if sct is None:
+        sct = _tls.sct = mss.mss()
+    return sct
+
+def grab_region(region):
+    """Zero-copy BGRA view over the mss capture buffer (no np.array copy)."""
+    shot = _sct().grab(region)
+    return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+def _menu_binarize(img_bgra, scale):
+    gray = cv2.cvtColor(img_bgra, cv2.COLOR_BGRA2GRAY, dst=_scratch("menu_gray", img_bgra.shape[:2]))
+    if scale != 1.0:
+        gray = _resize_into("menu_small", gray, scale, cv2.INTER_AREA)
+    # Otsu picks the cutoff per frame, so bright/dim scenes don't wipe out the text
+    return cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU, dst=gray)[1]
+
+def _menu_binarize_umat(img_bgra, scale):
+    """Same steps as _menu_binarize, on the OpenCL device."""
+    gray = cv2.cvtColor(cv2.UMat(img_bgra), cv2.COLOR_BGRA2GRAY)
+    if scale != 1.0:
+        gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    gray = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
+    return gray.get()
+
+def ocr_normalized(img_bgra: np.ndarray, scale: float = OCR_MENU_SCALE) -> str:
     """OCR tuned for menu keyword detection (spaces removed)."""
-    gray = cv2.cvtColor(img_bgra, cv2.COLOR_BGRA2GRAY)
-    gray = cv2.threshold(gray, 150, 255, cv2.THRESH_BINARY)[1]
-    txt = pytesseract.image_to_string(gray).upper()
+    _lazy_ocr()
+    binarize = _menu_binarize_umat if OCR_USE_OPENCL else _menu_binarize
+    gray = binarize(img_bgra, scale)
+    txt = ocr_image(gray, OCR_MENU_PSM, binary=True).upper()
     return txt.replace(" ", "").strip()
 
 def ocr_score_text(img_bgra: np.ndarray) -> str:
     """OCR tuned for scoreboard/table reading (box score TEAM/TOTAL)."""
-    gray = cv2.cvtColor(img_bgra, cv2.COLOR_BGRA2GRAY)
-    gray = cv2.threshold(gray, 185, 255, cv2.THRESH_BINARY)[1]
+    _lazy_ocr()
+    gray = _binarize("score_gray", img_bgra, 185)
 
     # upscale to help small text
-    gray = cv2.resize(gray, None, fx=2.2, fy=2.2, interpolation=cv2.INTER_CUBIC)
+    gray = _resize_into("score_big", gray, 2.2, cv2.INTER_LINEAR)
 
-    config = (
-        "--oem 3 --psm 6 "
-        "-c tessedit_char_whitelist=ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 "
-    )
-    txt = pytesseract.image_to_string(gray, config=config).upper()
+    txt = ocr_image(gray, 6, whitelist=SCORE_WHITELIST).upper()
     txt = txt.replace("\r", "")
 
     # small cleanup for common misses
@@ -137,19 +359,26 @@ def ocr_score_text(img_bgra: np.ndarray) -> str:
 
 def ocr_score_strip(img_bgra: np.ndarray) -> str:
     """OCR tuned for the small top score table (TEAM/quarters/TOTAL)."""
-    gray = cv2.cvtColor(img_bgra, cv2.COLOR_BGRA2GRAY)
-    gray = cv2.resize(gray, None, fx=2.0, fy=2.0, interpolation=cv2.INTER_CUBIC)
-    gray = cv2.threshold(gray, 170, 255, cv2.THRESH_BINARY)[1]
-
-    config = "--oem 3 --psm 6"
-    txt = pytesseract.image_to_string(gray, config=config).upper()
+    _lazy_ocr()
+    # Threshold at native resolution, then upscale (4x fewer pixels through the threshold)
+    gray = _binarize("strip_gray", img_bgra, 170)
+    gray = _crop_to_ink(gray, pad=4)
+    gray = _resize_into("strip_big", gray, 2.0, cv2.INTER_LINEAR)
+
+    # With tesserocr, OCR each table row as a single line (psm 7 skips page layout
+    # analysis). Through pytesseract every row would cost a process spawn, so keep psm 6.
+    rows = _text_rows(gray) if _tesserocr is not None else ()
+    if len(rows) >= 2:
+        txt = "\n".join(ocr_image(gray[y0:y1], 7) for y0, y1 in rows).upper()
+    else:
+        txt = ocr_image(gray, 6).upper()
     txt = txt.replace("\r", "")
 
     # common OCR drops
     txt = txt.replace("OTAL", "TOTAL")
 
     # normalize whitespace BUT KEEP LINE BREAKS
-    txt = "\n".join(re.sub(r"\s+", " ", ln).strip() for ln in txt.splitlines() if ln.strip())
+    txt = "\n".join(_RE_WS.sub(" ", ln).strip() for ln in txt.splitlines() if ln.strip())
 
     return txt.strip()
 
@@ -158,34 +387,121 @@ def ocr_score_strip(img_bgra: np.ndarray) -> str:
 def scores_plausible(s1, s2) -> bool:
     if s1 is None or s2 is None:
         return False
-    if not (0 <= s1 <= MAX_SCORE and 0 <= s2 <= MAX_SCORE):
-        return False
-    if s1 < MIN_SCORE or s2 < MIN_SCORE:
-        return False
-    if (s1 + s2) < MIN_TOTAL:
-        return False
-    return True
+    return MIN_SCORE <= s1 <= MAX_SCORE and MIN_SCORE <= s2 <= MAX_SCORE and s1 + s2 >= MIN_TOTAL
 
 """
 NOTE: score parsing is done by locating the two TEAM rows and taking the LAST number on each row as TOTAL.
 This avoids accidentally grabbing player stats numbers.
 """
 
+# End-of-game indicators (spaces removed)
+END_SCREEN_KEYWORDS = ("GAMEREEL", "GMOMENTS", "PRESSBOOK", "GAMEWRAPUP", "WRAPUP", "GAMESTATS")
+
+# Gameplay-ish indicators (helps avoid false triggers)
+GAMEPLAY_KEYWORDS = (
+    "ARENA", "CENTER", "PARK", "ORACLE", "GARDEN", "STAPLES",
+    "DEFENSE", "OFFENSE", "REBOUND", "FOUL", "SHOT",
+)
+
+# Compiled once: one regex scan per keyword set instead of a Python-level `in` per keyword.
+# ":" (game clock) counts as a gameplay signal too.
+_END_SCREEN_RE = re.compile("|".join(map(re.escape, END_SCREEN_KEYWORDS)))
+_GAMEPLAY_RE = re.compile("|".join(map(re.escape, GAMEPLAY_KEYWORDS + (":",))))
+
+@lru_cache(maxsize=256)  # consecutive polls often OCR the exact same text
 def classify_screen(text_no_spaces: str):
-    # End-of-game indicators (spaces removed)
-    if any(k in text_no_spaces for k in ["GAMEREEL", "GMOMENTS", "PRESSBOOK", "GAMEWRAPUP", "WRAPUP", "GAMESTATS"]):
+    if _END_SCREEN_RE.search(text_no_spaces):
         return "END_SCREEN"
 
-    # Gameplay-ish indicators (helps avoid false triggers)
-    gameplay_signals = [
-        "ARENA", "CENTER", "PARK", "ORACLE", "GARDEN", "STAPLES",
-        "DEFENSE", "OFFENSE", "REBOUND", "FOUL", "SHOT"
-    ]
-    if any(k in text_no_spaces for k in gameplay_signals) or ":" in text_no_spaces:
+    if _GAMEPLAY_RE.search(text_no_spaces):
         return "GAMEPLAY"
 
     return "UNKNOWN"
 
+# Last (thumbnail crc, text) per region, so a static screen doesn't re-run Tesseract
+_OCR_CACHE = {}
+
+def ocr_menu_region(region, scale=OCR_MENU_SCALE):
+    """Grab + menu OCR a region, reusing the previous text if the frame hasn't changed."""
+    _lazy_ocr()
+    img = grab_region(region)
+    thumb = cv2.resize(img, (32, 16), dst=_scratch("thumb", (16, 32, 4)), interpolation=cv2.INTER_AREA)
+    frame_hash = zlib.crc32(thumb)
+
+    key = (region["top"], region["left"], region["width"], region["height"], scale)
+    cached = _OCR_CACHE.get(key)
+    if cached is not None and cached[0] == frame_hash:
+        return cached[1]
+
+    text = ocr_normalized(img, scale)
+    _OCR_CACHE[key] = (frame_hash, text)
+    return text
+
+def read_end_screen(regions=(OCR_REGION_BANNER, OCR_REGION_STRIP), scale=OCR_MENU_SCALE):
+    """OCR the bands in order, stopping early only on an END_SCREEN hit.
+
+    END_SCREEN in any band beats GAMEPLAY in another (a clock in the banner band must
+    not hide GAMEREEL further down), same as classifying the whole region at once.
+    Returns (text, screen, region) where region is the band that decided the result.
+    """
+    result = None
+    for region in regions:
+        text = ocr_menu_region(region, scale)
+        screen = classify_screen(text)
+        if screen == "END_SCREEN":
+            return text, screen, region
+        if result is None or (screen == "GAMEPLAY" and result[1] == "UNKNOWN"):
+            result = (text, screen, region)
+    return result
+
+# Background end-screen OCR. The worker only polls while ocr_active is set and hands
+# (grab_time, text, screen) to the main loop through a 1-slot queue (newest wins).
+ocr_active = threading.Event()
+ocr_results = queue.Queue(maxsize=1)
+
+def ocr_worker():
+    next_ocr_at = time.monotonic()
+    confirm_region = None
+    unknown_streak = 0
+    while True:
+        if not ocr_active.is_set():
+            ocr_active.wait()
+            # New end-screen wait: drop what the previous game's wait left behind
+            confirm_region = None
+            unknown_streak = 0
+
+        now = time.monotonic()
+        if now < next_ocr_at:
+            time.sleep(next_ocr_at - now)
+            continue
+        # Fixed cadence; resync instead of bursting if an OCR pass overran the interval
+        next_ocr_at = max(next_ocr_at + CHECK_INTERVAL, time.monotonic())
+
+        # While confirming an end screen, only re-read the band that showed it
+        regions = (confirm_region,) if confirm_region else (OCR_REGION_BANNER, OCR_REGION_STRIP)
+
+        # Downscaled reads are enough for the block-letter banners; retry at full res if they keep missing
+        scale = 1.0 if unknown_streak >= OCR_FULLRES_AFTER_UNKNOWNS else OCR_MENU_SCALE
+
+        grabbed_at = time.monotonic()
+        try:
+            text, screen, region = read_end_screen(regions, scale)
+        except Exception as e:
+            print("[OCR] worker error:", repr(e))
+            confirm_region = None
+            continue
+        unknown_streak = unknown_streak + 1 if screen == "UNKNOWN" else 0
+        confirm_region = region if screen == "END_SCREEN" else None
+        if screen == "END_SCREEN":
+            # Confirm quickly; reliability comes from ENDSCREEN_CONFIRMATIONS, not the wait
+            next_ocr_at = min(next_ocr_at, grabbed_at + CHECK_INTERVAL_FAST)
+
+        try:
+            ocr_results.get_nowait()
+        except queue.Empty:
+            pass
+        ocr_results.put_nowait((grabbed_at, text, screen))
+
 # -----------------------------
 # LOGGING + TEAM NORMALIZATION
 # -----------------------------
@@ -198,7 +514,60 @@ KNOWN_TEAMS = [
     "EAST ALL-STARS","WEST ALL-STARS","EAST ALLSTARS","WEST ALLSTARS",
     "BOBCATS",
 ]
+_KNOWN_TEAMS_TUPLE = tuple(KNOWN_TEAMS)
+KNOWN_TEAMS_SET = frozenset(KNOWN_TEAMS)  # O(1) membership checks
+
+def closest_team(name, cutoff):
+    """Closest KNOWN_TEAMS entry with similarity >= cutoff (0-1), or None.
+
+    Always decided by difflib, so the logged name doesn't depend on rapidfuzz being
+    installed. rapidfuzz only prefilters: its fuzz.ratio (LCS based) is never below
+    difflib's ratio, so nothing difflib would accept is dropped.
+    """
+    choices = KNOWN_TEAMS
+    if fuzz_process is not None:
+        hits = fuzz_process.extract(name, _KNOWN_TEAMS_TUPLE, scorer=fuzz.ratio,
+                                    score_cutoff=cutoff * 100 - 1e-6, limit=None)
+        if not hits:
+            return None
+        choices = [h[0] for h in hits]
+    match = difflib.get_close_matches(name, choices, n=1, cutoff=cutoff)
+    return match[0] if match else None
+
+# 1/I -> H is common in your logs (HAWKS -> 1AVYKS)
+# 0 -> O, 5 -> S, 8 -> B can help too.
+_TEAM_DIGIT_FIX = str.maketrans({
+    "0": "O",
+    "1": "H",
+    "5": "S",
+    "8": "B",
+})
+
+# Your previous quick fixes. Correct spellings that contain a fix key map to
+# themselves so they're left alone (otherwise 76ERS -> 776ERS).
+TEAM_FIXES = {
+    "6ERS": "76ERS",
+    "76ERS": "76ERS",
+    "AVALIERS": "CAVALIERS",
+    "CAVALIER": "CAVALIERS",
+    "CAVALIERS": "CAVALIERS",
+    "SOBCATS": "BOBCATS",
+    "VIZARDS": "WIZARDS",
+    "SRIZZLIES": "GRIZZLIES",
+
+    # All-Star variants
+    "ALLSTARS": "ALL-STARS",
+    "ALL STARS": "ALL-STARS",
+
+    # Extra: common Hawks OCR weirdness
+    "HAVYKS": "HAWKS",
+    "HA VKS": "HAWKS",
+    "HAWK S": "HAWKS",
+}
+# Longest keys first so e.g. CAVALIERS wins over CAVALIER at the same position
+_TEAM_FIX_RE = re.compile("|".join(map(re.escape, sorted(TEAM_FIXES, key=len, reverse=True))))
 
+@lru_cache(maxsize=1024)  # rechecks of the same frame re-OCR identical team strings
 def normalize_team_name(raw_team: str):
     if not raw_team:
         return None
@@ -206,8 +575,8 @@ def normalize_team_name(raw_team: str):
     t = raw_team.upper()
 
     # Keep only letters/numbers/spaces
-    t = re.sub(r"[^A-Z0-9 ]", "", t)
-    t = re.sub(r"\s+", " ", t).strip()
+    t = _RE_NONALNUM.sub("", t)
+    t = _RE_WS.sub(" ", t).strip()
 
     # Drop single-letter trailing tokens that OCR often invents (e.g., "... Z")
     parts = t.split()
@@ -216,38 +585,17 @@ def normalize_team_name(raw_team: str):
     t = " ".join(parts)
 
     # Common digit->letter OCR fixes (team names are letters)
-    # 1/I -> H is common in your logs (HAWKS -> 1AVYKS)
-    # 0 -> O, 5 -> S, 8 -> B can help too.
-    trans = str.maketrans({
-        "0": "O",
-        "1": "H",
-        "5": "S",
-        "8": "B",
-    })
-    t = t.translate(trans)
-
-    # Your previous quick fixes
-    t = t.replace("6ERS", "76ERS")
-    t = t.replace("AVALIERS", "CAVALIERS")
-    t = t.replace("CAVALIER", "CAVALIERS")
-    t = t.replace("SOBCATS", "BOBCATS")
-    t = t.replace("VIZARDS", "WIZARDS")
-    t = t.replace("SRIZZLIES", "GRIZZLIES")
+    t = t.translate(_TEAM_DIGIT_FIX)
 
-    # All-Star variants
-    t = t.replace("ALLSTARS", "ALL-STARS").replace("ALL STARS", "ALL-STARS")
-
-    # Extra: common Hawks OCR weirdness
-    t = t.replace("HAVYKS", "HAWKS")
-    t = t.replace("HA VKS", "HAWKS").replace("HAWK S", "HAWKS")
+    # Known misreads, all fixed in one pass
+    t = _TEAM_FIX_RE.sub(lambda m: TEAM_FIXES[m.group(0)], t)
 
     # Exact known-team hit
-    if t in KNOWN_TEAMS:
+    if t in KNOWN_TEAMS_SET:
         return t
 
     # Fuzzy match to closest known team
-    match = difflib.get_close_matches(t, KNOWN_TEAMS, n=1, cutoff=0.55)
-    return match[0] if match else t
+    return closest_team(t, 0.55) or t
 
 def ensure_csv_header():
     if not os.path.exists(LOG_CSV):
@@ -259,96 +607,25 @@ def load_games_played_from_csv():
     if not os.path.exists(LOG_CSV):
         return 0
     try:
-        with open(LOG_CSV, "r", encoding="utf-8") as f:
-            rows = list(csv.reader(f))
-        if len(rows) <= 1:
+        # Only the last row matters: read the end of the file instead of the whole log
+        # (8 KB comfortably covers one row, raw OCR column included)
+        with open(LOG_CSV, "rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            f.seek(max(0, size - 8192))
+            lines = [ln for ln in f.read().splitlines() if ln.strip()]
+        if not lines:
             return 0
-        return int(rows[-1][0])
+        return int(lines[-1].split(b",", 1)[0])
     except:
         return 0
-def normalize_team(name: str):
-    if not name:
-        return None
-
-    name = name.upper()
-    name = re.sub(r"[^A-Z0-9 ]", "", name)
-    name = re.sub(r"\s+", " ", name).strip()
-
-    # Common OCR confusions
-    name = name.replace("0", "O").replace("1", "I").replace("5", "S")
-
-    TEAM_MAP = {
-        "SIXERS": "76ERS",
-        "76ERS": "76ERS",
-        "SEVENTYSIXERS": "76ERS",
-
-        "BOBCAT": "BOBCATS",
-        "BOBCATS": "BOBCATS",
-
-        "WARRIOR": "WARRIORS",
-        "WARRIORS": "WARRIORS",
-
-        "SPUR": "SPURS",
-        "SPURS": "SPURS",
-
-        "CAV": "CAVALIERS",
-        "CAVS": "CAVALIERS",
-        "CAVALIERS": "CAVALIERS",
-
-        "BLAZER": "BLAZERS",
-        "BLAZERS": "BLAZERS",
-        "TRAILBLAZERS": "BLAZERS",
-
-        "WIZ": "WIZARDS",
-        "WIZARDS": "WIZARDS",
-
-        "GRIZZ": "GRIZZLIES",
-        "GRIZZLIES": "GRIZZLIES",
-
-        "TIMBER": "TIMBERWOLVES",
-        "WOLVES": "TIMBERWOLVES",
-        "TIMBERWOLVES": "TIMBERWOLVES",
-
-        "KNICK": "KNICKS",
-        "KNICKS": "KNICKS",
-
-        "HAWK": "HAWKS",
-        "HAWKS": "HAWKS",
-
-        "BUCK": "BUCKS",
-        "BUCKS": "BUCKS",
-
-        "KING": "KINGS",
-        "KINGS": "KINGS",
-    }
-
-    # Exact map
-    if name in TEAM_MAP:
-        return TEAM_MAP[name]
-
-    # If your file already has KNOWN_TEAMS, use it when available
-    try:
-        if "KNOWN_TEAMS" in globals():
-            if name in KNOWN_TEAMS:
-                return name
-            # fuzzy match
-            m = difflib.get_close_matches(name, KNOWN_TEAMS, n=1, cutoff=0.60)
-            if m:
-                return m[0]
-    except Exception:
-        pass
-
-    # Partial map (safe)
-    for k, v in TEAM_MAP.items():
-        if k in name:
-            return v
-
-    return name
 
 # -----------------------------
 # FIX 2: STRICT PARSING (reject headers/garbage)
 # -----------------------------
 
+# Column headings of the box-score table (TEAM 1ST 2ND 3RD 4TH OT TOTAL)
+_HEADER_WORDS = frozenset({"TEAM", "1ST", "2ND", "3RD", "4TH", "OT", "TOTAL"})
+
 def parse_boxscore(raw: str):
     """
     Stricter parser with TOTAL auto-correction:
@@ -362,18 +639,16 @@ def parse_boxscore(raw: str):
     results = []
 
     for ln in lines:
-        clean = re.sub(r"[^A-Z0-9 ]", " ", ln)
-        clean = re.sub(r"\s+", " ", clean).strip()
+        clean = _RE_NONALNUM.sub(" ", ln)
+        clean = _RE_WS.sub(" ", clean).strip()
         if not clean:
             continue
 
         # HARD FILTER: skip header-like rows
-        header_words = {"TEAM", "1ST", "2ND", "3RD", "4TH", "OT", "TOTAL"}
-        tokens = set(clean.split())
-        if tokens & header_words:
+        if not _HEADER_WORDS.isdisjoint(clean.split()):
             continue
 
-        nums = [int(n) for n in re.findall(r"\b\d{1,3}\b", clean)]
+        nums = [int(n) for n in _RE_NUM3.findall(clean)]
         if len(nums) < 2:
             # Need quarters + total at minimum
             continue
@@ -393,8 +668,8 @@ def parse_boxscore(raw: str):
                 # If it's not close, OCR probably missed a digit.
                 total = qsum
 
-        team_part = re.sub(r"\b\d{1,3}\b", " ", clean)
-        team_part = re.sub(r"\s+", " ", team_part).strip()
+        team_part = _RE_NUM3.sub(" ", clean)
+        team_part = _RE_WS.sub(" ", team_part).strip()
         team_norm = normalize_team_name(team_part)
 
         if not team_norm or len(team_norm) < 4:
@@ -407,7 +682,7 @@ def parse_boxscore(raw: str):
 
     def score_candidate(item):
         team, total = item
-        exact = 1 if team in KNOWN_TEAMS else 0
+        exact = 1 if team in KNOWN_TEAMS_SET else 0
         return (exact, len(team), total)
 
     results.sort(key=score_candidate, reverse=True)
@@ -424,29 +699,26 @@ def parse_totals_by_team_lines(text: str):
     if not text:
         return None, None, None, None
 
-    header_words = {"TEAM", "1ST", "2ND", "3RD", "4TH", "OT", "TOTAL"}
-
     lines = []
     for ln in text.upper().splitlines():
-        ln = re.sub(r"[^A-Z0-9 ]", " ", ln)
-        ln = re.sub(r"\s+", " ", ln).strip()
+        ln = _RE_NONALNUM.sub(" ", ln)
+        ln = _RE_WS.sub(" ", ln).strip()
         if ln:
             lines.append(ln)
 
     candidates = []
     for ln in lines:
-        tokens = set(ln.split())
-        if tokens & header_words:
+        if not _HEADER_WORDS.isdisjoint(ln.split()):
             # skip header-like lines
             continue
 
-        nums = [int(x) for x in re.findall(r"\b\d+\b", ln)]
+        nums = [int(x) for x in _RE_NUM.findall(ln)]
         if len(nums) < 2:
             continue
 
         # team text = line with numbers removed
-        team_part = re.sub(r"\b\d+\b", " ", ln)
-        team_part = re.sub(r"\s+", " ", team_part).strip()
+        team_part = _RE_NUM.sub(" ", ln)
+        team_part = _RE_WS.sub(" ", team_part).strip()
 
         team = normalize_team_name(team_part)  # <-- IMPORTANT: use the better normalizer
         total = nums[-1]
@@ -466,28 +738,18 @@ def parse_totals_by_team_lines(text: str):
     return t1, s1, t2, s2
 
 
-def scores_plausible(s1, s2) -> bool:
-    if s1 is None or s2 is None:
-        return False
-    if s1 < MIN_SCORE or s2 < MIN_SCORE:
-        return False
-    if (s1 + s2) < MIN_TOTAL:
-        return False
-    if s1 > MAX_SCORE or s2 > MAX_SCORE:
-        return False
-    return True
+def read_score_strip(region, seen):
+    """Grab, OCR and parse a score strip.
 
-
-def scores_plausible(s1, s2) -> bool:
-    if s1 is None or s2 is None:
-        return False
-    if s1 < MIN_SCORE or s2 < MIN_SCORE:
-        return False
-    if (s1 + s2) < MIN_TOTAL:
-        return False
-    if s1 > MAX_SCORE or s2 > MAX_SCORE:
-        return False
-    return True
+    `seen` maps (shape, crc32) of earlier captures to their (raw, parse) result, so a
+    recheck of a byte-identical frame skips Tesseract (it would read it the same way).
+    """
+    img = grab_region(region)
+    key = (img.shape, zlib.crc32(img))
+    if key not in seen:
+        raw = ocr_score_strip(img)
+        seen[key] = (raw, parse_totals_by_team_lines(raw))
+    return seen[key]
 
 def log_box_score(game_number: int):
     """Log final score to CSV with safe re-checks.
@@ -500,18 +762,20 @@ def log_box_score(game_number: int):
 
     best = (None, None, None, None, "")
     raw_combined = ""
+    seen = {}
 
     for attempt in range(MAX_RECHECKS + 1):
+        # Start both strips at once; the fallback is only used if the primary doesn't
+        # parse, but then it's already (or nearly) done instead of starting from scratch.
+        primary = _SCORE_POOL.submit(read_score_strip, BOX_SCORE_REGION, seen)
+        fallback = _SCORE_POOL.submit(read_score_strip, BOX_SCORE_REGION_FALLBACK, seen)
+
         # 1) Primary strip
-        img = grab_region(BOX_SCORE_REGION)
-        raw = ocr_score_strip(img)
-        t1, s1, t2, s2 = parse_totals_by_team_lines(raw)
+        raw, (t1, s1, t2, s2) = primary.result()
 
         # 2) Fallback strip (taller/wider)
         if t1 is None or s1 is None or t2 is None or s2 is None:
-            img2 = grab_region(BOX_SCORE_REGION_FALLBACK)
-            raw2 = ocr_score_strip(img2)
-            t1, s1, t2, s2 = parse_totals_by_team_lines(raw2)
+            raw2, (t1, s1, t2, s2) = fallback.result()
             raw = raw + " || FALLBACK_STRIP || " + raw2
 
         raw_combined = raw
@@ -547,51 +811,130 @@ def log_box_score(game_number: int):
 # INPUT HELPERS
 # -----------------------------
 
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    KEYEVENTF_SCANCODE = 0x0008
+
+    class _KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _MOUSEINPUT(ctypes.Structure):
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    # INPUT must be sized for its largest member (MOUSEINPUT) or SendInput rejects it
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+    class _INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("u", _INPUTUNION)]
+
+    _SendInput = ctypes.windll.user32.SendInput
+
+# Prebuilt SendInput arrays keyed by (keys, up)
+_INPUT_BATCHES = {}
+
+def _send_keys(keys, up=False):
+    """Press or release several keys as one atomic SendInput batch.
+
+    Falls back to the `keyboard` module off Windows or for keys without a scancode.
+    """
+    keys = tuple(keys)
+    if os.name != "nt" or not all(k in SCANCODES for k in keys):
+        for k in keys:
+            if up:
+                keyboard.release(k)
+            else:
+                keyboard.press(k)
+        return
+
+    batch = _INPUT_BATCHES.get((keys, up))
+    if batch is None:
+        flags = KEYEVENTF_SCANCODE | (KEYEVENTF_KEYUP if up else 0)
+        batch = (_INPUT * len(keys))()
+        for i, k in enumerate(keys):
+            batch[i].type = INPUT_KEYBOARD
+            batch[i].u.ki.wScan = SCANCODES[k]
+            batch[i].u.ki.dwFlags = flags
+        _INPUT_BATCHES[(keys, up)] = batch
+
+    _SendInput(len(batch), batch, ctypes.sizeof(_INPUT))
+
+def precise_sleep(seconds):
+    """Sleep with sub-ms accuracy: time.sleep for the bulk, then spin up to the deadline.
+
+    The sleep part relies on the 1ms timer resolution requested in main() on Windows,
+    so only the last PRECISE_SLEEP_SPIN seconds burn CPU.
+    """
+    deadline = time.perf_counter() + seconds
+    if seconds > PRECISE_SLEEP_SPIN:
+        time.sleep(seconds - PRECISE_SLEEP_SPIN)
+    while time.perf_counter() < deadline:
+        pass
+
+def keys_down(keys):
+    _send_keys(keys, up=False)
+
+def keys_up(keys):
+    _send_keys(keys, up=True)
+
 def press_key(key, duration=0.55):
-    keyboard.press(key)
-    time.sleep(duration)
-    keyboard.release(key)
-    time.sleep(INPUT_GAP)
+    keys_down([key])
+    precise_sleep(duration)
+    keys_up([key])
+    precise_sleep(INPUT_GAP)
 
 def press_and_hold_to_confirm(confirm_key, hold_keys):
     """
     Hold direction key(s) -> wait -> press X while held -> release X -> release direction(s)
     """
-    for k in hold_keys:
-        keyboard.press(k)
+    keys_down(hold_keys)
 
-    time.sleep(MENU_DIR_HOLD_BEFORE_CONFIRM)
+    precise_sleep(MENU_DIR_HOLD_BEFORE_CONFIRM)
 
-    keyboard.press(confirm_key)
-    time.sleep(MENU_CONFIRM_HOLD)
-    keyboard.release(confirm_key)
+    keys_down([confirm_key])
+    precise_sleep(MENU_CONFIRM_HOLD)
+    keys_up([confirm_key])
 
-    time.sleep(MENU_RELEASE_AFTER)
+    precise_sleep(MENU_RELEASE_AFTER)
 
-    for k in hold_keys:
-        keyboard.release(k)
+    keys_up(hold_keys)
 
-    time.sleep(INPUT_GAP)
+    precise_sleep(INPUT_GAP)
 
 def stick_force(key, hold_time=FORCE_SIDE_HOLD, settle=0.45):
-    keyboard.press(key)
-    time.sleep(hold_time)
-    keyboard.release(key)
-    time.sleep(settle)
+    keys_down([key])
+    precise_sleep(hold_time)
+    keys_up([key])
+    precise_sleep(settle)
 
 def stick_step(key, step_time=CENTER_STEP_TIME, settle=0.65):
-    keyboard.press(key)
-    time.sleep(step_time)
-    keyboard.release(key)
-    time.sleep(settle)
+    keys_down([key])
+    precise_sleep(step_time)
+    keys_up([key])
+    precise_sleep(settle)
 
 def randomize_team():
-    keyboard.press(KEY_L2)
-    keyboard.press(KEY_R2)
-    time.sleep(0.55)
-    keyboard.release(KEY_L2)
-    keyboard.release(KEY_R2)
-    time.sleep(0.40)
+    keys_down([KEY_L2, KEY_R2])
+    precise_sleep(0.55)
+    keys_up([KEY_L2, KEY_R2])
+    precise_sleep(0.40)
 
 # -----------------------------
 # ACTIONS
@@ -659,46 +1002,58 @@ def main():
     print(f"Loaded games played: {games_played}")
     print("BOT RUNNING — Press ESC to stop (may require admin).")
 
-    while True:
-        if keyboard.is_pressed("esc"):
-            print("ESC pressed — exiting")
-            return
+    if os.name == "nt":
+        # Default Windows timer granularity (~15.6ms) skews menu hold timings
+        ctypes.windll.winmm.timeBeginPeriod(1)
+        atexit.register(ctypes.windll.winmm.timeEndPeriod, 1)
+
+    keyboard.add_hotkey("esc", stop_requested.set)
+    threading.Thread(target=ocr_worker, daemon=True).start()
+    wait_started = 0.0
 
-        now = time.time()
+    while not stop_requested.is_set():
+        now = time.monotonic()
 
         # Lockout during gameplay so we don't react to random OCR noise mid-game
         if state == BotState.GAME_RUNNING:
             if now < game_lock_until:
-                time.sleep(10)
+                time.sleep(LOOP_TICK)
                 continue
             else:
                 state = BotState.WAIT_FOR_END
                 end_hits = 0
 
         if state == BotState.WAIT_FOR_END:
-            img = grab_region(OCR_REGION)
-            text = ocr_normalized(img)
-            print("OCR:", text)
+            if not ocr_active.is_set():
+                _OCR_CACHE.clear()  # new wait: don't reuse last game's frame hashes
+                wait_started = time.monotonic()
+                ocr_active.set()
 
-            screen = classify_screen(text)
+            # Short timeout keeps ESC responsive while the worker runs OCR
+            try:
+                grabbed_at, text, screen = ocr_results.get(timeout=LOOP_TICK)
+            except queue.Empty:
+                continue
+            if grabbed_at < wait_started:
+                continue  # stale frame from before this wait (e.g. previous game's menus)
+
+            print("OCR:", text)
 
             if screen == "GAMEPLAY":
                 end_hits = 0
-                time.sleep(CHECK_INTERVAL)
                 continue
 
             if screen == "END_SCREEN":
                 end_hits += 1
                 print(f"End screen hit {end_hits}/{ENDSCREEN_CONFIRMATIONS}")
                 if end_hits >= ENDSCREEN_CONFIRMATIONS:
+                    ocr_active.clear()
                     end_hits = 0
                     stats_logged_this_game = False
                     state = BotState.OPEN_POSTGAME_MENU
             else:
                 end_hits = 0
 
-            time.sleep(CHECK_INTERVAL)
-
         elif state == BotState.OPEN_POSTGAME_MENU:
             action_open_postgame_menu()
             time.sleep(SETTLE_SHORT)
@@ -739,8 +1094,10 @@ def main():
 
         elif state == BotState.QUICKGAME_SETUP:
             action_quickgame_setup_and_start()
-            game_lock_until = time.time() + GAME_LOCK_SECONDS
+            game_lock_until = time.monotonic() + GAME_LOCK_SECONDS
             state = BotState.GAME_RUNNING
 
+    print("ESC pressed — exiting")
+
 if __name__ == "__main__":
     main()
@@ -1,137 +1,197 @@
-import csv
+import heapq
+import os
+import sys
+import threading
 import time
+import zlib
 from collections import defaultdict
 from pathlib import Path
 
+try:
+    # Optional: react to file-change events instead of polling the CSV
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
 # -----------------------------
 # FILE PATHS
 # -----------------------------
 CSV_PATH = Path("nba2k10_results.csv")
 OUT_PATH = Path("overlay.txt")
 
-REFRESH_SECONDS = 5
-
-
-# -----------------------------
-# CSV READ
-# -----------------------------
-
-def read_games():
-    if not CSV_PATH.exists():
-        return []
-
-    with CSV_PATH.open("r", encoding="utf-8", newline="") as f:
-        r = csv.reader(f)
-        rows = [row for row in r if row and any(cell.strip() for cell in row)]
-
-    if len(rows) <= 1:
-        return []
+REFRESH_SECONDS = 5  # with watchdog: longest a burst of CSV writes can hold off a refresh
+WATCH_DEBOUNCE = 0.25  # with watchdog: wait for the CSV to go quiet this long before refreshing
 
-    games = []
-
-    # Defensive header detection
-    header_idx = 0
-    while header_idx < len(rows) and not rows[header_idx][0].strip():
-        header_idx += 1
-
-    for row in rows[header_idx + 1:]:
-        try:
-            gnum = int(row[0])
-            ts = row[1].strip() if len(row) > 1 else ""
-            t1 = row[2].strip()
-            s1 = int(row[3])
-            t2 = row[4].strip()
-            s2 = int(row[5])
-        except Exception:
-            continue
-
-        if not t1 or not t2:
-            continue
-
-        games.append((gnum, ts, t1, s1, t2, s2))
-
-    games.sort(key=lambda x: x[0])
-    return games
+# Without watchdog: poll every POLL_MIN_SECONDS after a change, backing off x1.5 per
+# idle poll up to POLL_MAX_SECONDS (games are minutes apart)
+POLL_MIN_SECONDS = 1.0
+POLL_MAX_SECONDS = 15.0
 
 
 # -----------------------------
-# TEAM STATS
+# CSV READ
 # -----------------------------
 
-def compute_team_stats(games):
-    wins = defaultdict(int)
-    losses = defaultdict(int)
-    points_for = defaultdict(int)
-    games_played = defaultdict(int)
+# How far into the CSV we've read. The bot only ever appends, so each refresh
+# parses just the rows written since the last one and folds them into `standings`.
+_reader = {
+    "file_id": None,  # (st_dev, st_ino) of the file last_offset refers to
+    "last_offset": 0,
+    "prefix_crc": 0,  # crc32 of the bytes before last_offset, to catch in-place edits
+}
+
+
+def parse_row(line):
+    """Parse one CSV line (bytes) into (gnum, ts, t1, s1, t2, s2), or None."""
+    # Plain split is safe: only raw_boxscore_ocr, the last column, can be quoted or
+    # contain commas, and maxsplit leaves it in one piece
+    row = line.split(b",", 6)
+    try:
+        gnum = int(row[0])
+        ts = row[1].strip().decode("utf-8")
+        # Interned: ~30 distinct names, so every row reuses the same key objects
+        t1 = sys.intern(row[2].strip().decode("utf-8"))
+        s1 = int(row[3])
+        t2 = sys.intern(row[4].strip().decode("utf-8"))
+        s2 = int(row[5])
+    except Exception:
+        return None  # header, blank or damaged row
+
+    if not t1 or not t2:
+        return None
 
-    for _, _, t1, s1, t2, s2 in games:
-        points_for[t1] += s1
-        points_for[t2] += s2
-        games_played[t1] += 1
-        games_played[t2] += 1
+    return (gnum, ts, t1, s1, t2, s2)
 
-        if s1 > s2:
-            wins[t1] += 1
-            losses[t2] += 1
-        elif s2 > s1:
-            wins[t2] += 1
-            losses[t1] += 1
 
-    win_pct = {}
-    ppg = {}
+def read_new_games():
+    """Parse the complete rows appended since the last call (all rows after a reset)."""
+    if not CSV_PATH.exists():
+        standings.reset()
+        _reader.update(file_id=None, last_offset=0, prefix_crc=0)
+        return []
 
-    for t in games_played:
-        gp = games_played[t]
-        win_pct[t] = wins[t] / gp if gp else 0.0
-        ppg[t] = points_for[t] / gp if gp else 0.0
+    with CSV_PATH.open("rb") as f:
+        st = os.fstat(f.fileno())
+        data = memoryview(f.read())
+    file_id = (st.st_dev, st.st_ino)
+    offset = _reader["last_offset"]
+
+    # Editors (Notepad, VS Code) save in place, keeping the inode. A crc over the
+    # already-parsed bytes catches hand fixes anywhere in the file; it's a C-speed
+    # pass, the parsing is what stays incremental.
+    if (file_id != _reader["file_id"] or len(data) < offset
+            or zlib.crc32(data[:offset]) != _reader["prefix_crc"]):
+        # New, replaced, truncated or edited file -> start over
+        standings.reset()
+        _reader.update(file_id=file_id, last_offset=0, prefix_crc=0)
+        offset = 0
+    tail = data[offset:].tobytes()
+
+    # Only take complete lines; a row that's still being written is picked up next time
+    end = tail.rfind(b"\n") + 1
+    if not end:
+        return []
+    _reader["last_offset"] += end
+    _reader["prefix_crc"] = zlib.crc32(tail[:end], _reader["prefix_crc"])
 
-    return wins, losses, win_pct, ppg, games_played
+    return [g for g in map(parse_row, tail[:end].splitlines()) if g]
 
 
 # -----------------------------
-# ALL-TIME GAME RECORDS
+# TEAM STATS + ALL-TIME GAME RECORDS
 # -----------------------------
 
-def compute_total_extremes(games):
-    if not games:
-        return None, None
-
-    with_totals = [
-        (gnum, t1, s1, t2, s2, s1 + s2)
-        for (gnum, _ts, t1, s1, t2, s2) in games
-    ]
-    return (
-        max(with_totals, key=lambda x: x[5]),
-        min(with_totals, key=lambda x: x[5]),
-    )
-
-
-def compute_biggest_blowout(games):
-    if not games:
-        return None
-
-    candidates = []
-    for (gnum, _ts, t1, s1, t2, s2) in games:
-        if s1 == s2:
-            continue
-        if s1 > s2:
-            candidates.append((gnum, t1, s1, t2, s2, s1 - s2))
-        else:
-            candidates.append((gnum, t2, s2, t1, s1, s2 - s1))
-
-    return max(candidates, key=lambda x: x[5]) if candidates else None
-
-
-def compute_highest_team_score(games):
-    if not games:
-        return None
-
-    candidates = []
-    for (gnum, _ts, t1, s1, t2, s2) in games:
-        candidates.append((gnum, t1, s1, t2, s2))
-        candidates.append((gnum, t2, s2, t1, s1))
-
-    return max(candidates, key=lambda x: x[2])
+class Standings:
+    """Team records and all-time game records, updated one batch of new games at a time."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.wins = defaultdict(int)
+        self.losses = defaultdict(int)
+        self.points_for = defaultdict(int)
+        self.games_played = defaultdict(int)
+        self.win_pct = {}
+        self.ppg = {}
+        self.win_pct_str = {}  # "HEAT 0.600 (3-2)"
+        self.ppg_str = {}      # "HEAT 101.4"
+        self.dirty = set()  # teams whose win_pct/ppg (and their strings) are stale
+
+        self.last_game = None   # highest game number seen
+        self.high_total = None  # (gnum, t1, s1, t2, s2, total)
+        self.low_total = None
+        self.blowout = None     # (gnum, winner, w_score, loser, l_score, margin)
+        self.high_team = None   # (gnum, team, score, opponent, opp_score)
+
+    def update(self, new_games):
+        wins = self.wins
+        losses = self.losses
+        points_for = self.points_for
+        games_played = self.games_played
+
+        for game in new_games:
+            gnum, _ts, t1, s1, t2, s2 = game
+
+            points_for[t1] += s1
+            points_for[t2] += s2
+            games_played[t1] += 1
+            games_played[t2] += 1
+
+            self.dirty.add(t1)
+            self.dirty.add(t2)
+
+            # Order the pair once; the W/L, blowout and team-score checks all read it.
+            # On a tie team1 stays first, which is what the team-score record expects.
+            if s1 >= s2:
+                win, win_s, lose, lose_s = t1, s1, t2, s2
+            else:
+                win, win_s, lose, lose_s = t2, s2, t1, s1
+            margin = win_s - lose_s
+
+            if margin:
+                wins[win] += 1
+                losses[lose] += 1
+
+            if self.last_game is None or gnum >= self.last_game[0]:
+                self.last_game = game
+
+            # Records: ties go to the lowest game number, then the earlier row in the file,
+            # same as max()/min() over the list sorted by game number did. Numbering can
+            # restart mid-file (the bot starts from 0 if it can't read the CSV).
+            total = s1 + s2
+            rec = self.high_total
+            if rec is None or total > rec[5] or (total == rec[5] and gnum < rec[0]):
+                self.high_total = (gnum, t1, s1, t2, s2, total)
+            rec = self.low_total
+            if rec is None or total < rec[5] or (total == rec[5] and gnum < rec[0]):
+                self.low_total = (gnum, t1, s1, t2, s2, total)
+
+            rec = self.blowout
+            if margin and (rec is None or margin > rec[5] or (margin == rec[5] and gnum < rec[0])):
+                self.blowout = (gnum, win, win_s, lose, lose_s, margin)
+
+            rec = self.high_team
+            if rec is None or win_s > rec[2] or (win_s == rec[2] and gnum < rec[0]):
+                self.high_team = (gnum, win, win_s, lose, lose_s)
+
+    def rates(self):
+        """win_pct and ppg dicts, recomputed only for teams that played since the last call.
+
+        Also refreshes those teams' leaderboard strings in win_pct_str / ppg_str.
+        """
+        for t in self.dirty:
+            gp = self.games_played[t]
+            self.win_pct[t] = self.wins[t] / gp if gp else 0.0
+            self.ppg[t] = self.points_for[t] / gp if gp else 0.0
+            self.win_pct_str[t] = f"{t} {self.win_pct[t]:.3f} ({self.wins[t]}-{self.losses[t]})"
+            self.ppg_str[t] = f"{t} {self.ppg[t]:.1f}"
+        self.dirty.clear()
+        return self.win_pct, self.ppg
+
+
+standings = Standings()
 
 
 # -----------------------------
@@ -139,29 +199,37 @@ def compute_highest_team_score(games):
 # -----------------------------
 
 def rank_top_bottom(teams, key_fn, n=3):
-    ranked = sorted(teams, key=key_fn, reverse=True)
-    return ranked[:n], list(reversed(ranked[-n:]))
+    # Only n teams are needed from each end, so skip the full sort. Keys are computed
+    # once and shared by both heaps (they end with the team name, so they're unique).
+    keyed = [(key_fn(t), t) for t in teams]
+    top = [t for _, t in heapq.nlargest(n, keyed)]
+    bottom = [t for _, t in heapq.nsmallest(n, keyed)]
+    return top, bottom
 
 
 # -----------------------------
 # TICKER FORMAT
 # -----------------------------
 
-def format_ticker(games):
-    if not games:
-        return "NBA 2K10 SIM — LIVE  |  Waiting for results...     "
+_EMPTY_TICKER = "NBA 2K10 SIM — LIVE  |  Waiting for results...     "
+
 
-    wins, losses, win_pct, ppg, games_played = compute_team_stats(games)
-    teams = set(games_played.keys())
+def format_ticker(st):
+    if st.last_game is None:
+        return _EMPTY_TICKER
+
+    wins, losses, games_played = st.wins, st.losses, st.games_played
+    win_pct, ppg = st.rates()
+    teams = games_played.keys()
 
     # Last game
-    gnum, ts, t1, s1, t2, s2 = games[-1]
+    gnum, ts, t1, s1, t2, s2 = st.last_game
     last_final = f"FINAL #{gnum}: {t1} {s1}, {t2} {s2}"
 
     # Records
-    high_game, low_game = compute_total_extremes(games)
-    blowout = compute_biggest_blowout(games)
-    high_team = compute_highest_team_score(games)
+    high_game, low_game = st.high_total, st.low_total
+    blowout = st.blowout
+    high_team = st.high_team
 
     hg = f"HIGHEST TOTAL: #{high_game[0]} {high_game[1]} {high_game[2]}-{high_game[3]} {high_game[4]} ({high_game[5]})"
     lg = f"LOWEST TOTAL: #{low_game[0]} {low_game[1]} {low_game[2]}-{low_game[3]} {low_game[4]} ({low_game[5]})"
@@ -186,10 +254,10 @@ def format_ticker(games):
     top_w, bot_w = rank_top_bottom(teams, winpct_key)
     top_p, bot_p = rank_top_bottom(teams, ppg_key)
 
-    top_win = "TOP WIN%: " + ", ".join(f"{t} {win_pct[t]:.3f} ({wins[t]}-{losses[t]})" for t in top_w)
-    bot_win = "LOWEST WIN%: " + ", ".join(f"{t} {win_pct[t]:.3f} ({wins[t]}-{losses[t]})" for t in bot_w)
-    top_ppg = "TOP PPG: " + ", ".join(f"{t} {ppg[t]:.1f}" for t in top_p)
-    bot_ppg = "BOTTOM PPG: " + ", ".join(f"{t} {ppg[t]:.1f}" for t in bot_p)
+    top_win = "TOP WIN%: " + ", ".join(st.win_pct_str[t] for t in top_w)
+    bot_win = "LOWEST WIN%: " + ", ".join(st.win_pct_str[t] for t in bot_w)
+    top_ppg = "TOP PPG: " + ", ".join(st.ppg_str[t] for t in top_p)
+    bot_ppg = "BOTTOM PPG: " + ", ".join(st.ppg_str[t] for t in bot_p)
 
     return "  |  ".join([
         "NBA 2K10 SIM — LIVE",
@@ -209,22 +277,105 @@ def format_ticker(games):
 # MAIN LOOP
 # -----------------------------
 
-def main():
-    last_size = None
-    print("[overlay] running...")
+_last_text = None  # last ticker written to OUT_PATH
+_out_fd = None     # OUT_PATH, kept open between refreshes
+
+
+def write_overlay(text):
+    """Overwrite OUT_PATH in place: seek + one write + truncate on a long-lived fd."""
+    global _out_fd
+    if _out_fd is None:
+        # O_BINARY: no newline translation on Windows (0 elsewhere)
+        _out_fd = os.open(OUT_PATH, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+    data = text.encode("utf-8")
+    os.lseek(_out_fd, 0, os.SEEK_SET)
+    os.write(_out_fd, data)
+    os.ftruncate(_out_fd, len(data))
+
+
+def csv_stamp():
+    """(size, mtime, inode) of the CSV, or 0 if it's missing.
+
+    Size alone misses a CSV replaced by a file of the same length.
+    """
+    try:
+        st = CSV_PATH.stat()
+    except FileNotFoundError:
+        return 0
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+def refresh(last_stamp):
+    """Rewrite the overlay if the CSV changed. Returns the csv_stamp() seen."""
+    global _last_text
+    try:
+        stamp = csv_stamp()
+        if stamp != last_stamp:
+            new_games = read_new_games()
+            standings.update(new_games)
+            text = format_ticker(standings)
+            # Same text (header-only or partial-row write): leave the file and its mtime alone
+            if text != _last_text:
+                write_overlay(text)
+                _last_text = text
+                print("[overlay] updated")
+        return stamp
+    except Exception as e:
+        print("[overlay] error:", repr(e))
+        return last_stamp
+
 
+def poll_loop():
+    last_stamp = None
+    delay = POLL_MIN_SECONDS
     while True:
-        try:
-            size = CSV_PATH.stat().st_size if CSV_PATH.exists() else 0
-            if size != last_size:
-                games = read_games()
-                OUT_PATH.write_text(format_ticker(games), encoding="utf-8")
-                print("[overlay] updated")
-                last_size = size
-        except Exception as e:
-            print("[overlay] error:", repr(e))
+        stamp = refresh(last_stamp)
+        if stamp != last_stamp:
+            delay = POLL_MIN_SECONDS
+        else:
+            delay = min(delay * 1.5, POLL_MAX_SECONDS)
+        last_stamp = stamp
+        time.sleep(delay)
+
+
+def watch_loop():
+    """Block on filesystem events for the CSV (inotify / ReadDirectoryChangesW / FSEvents)."""
+    changed = threading.Event()
+    target = os.path.normcase(os.path.abspath(CSV_PATH))
+
+    class CsvHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if any(p and os.path.normcase(os.path.abspath(p)) == target for p in paths):
+                changed.set()
+
+    observer = Observer()
+    observer.schedule(CsvHandler(), os.path.dirname(target))
+    observer.start()
+
+    last_stamp = None
+    changed.set()  # initial render
+    try:
+        while True:
+            changed.wait()
+            changed.clear()
+            # Coalesce a burst of events (one CSV append can fire several) into one refresh,
+            # but never hold off longer than the polling interval would have
+            deadline = time.monotonic() + REFRESH_SECONDS
+            while changed.wait(WATCH_DEBOUNCE) and time.monotonic() < deadline:
+                changed.clear()
+            last_stamp = refresh(last_stamp)
+    finally:
+        observer.stop()
+        observer.join()
+
 
-        time.sleep(REFRESH_SECONDS)
+def main():
+    print("[overlay] running...")
+    if Observer is not None:
+        watch_loop()
+    else:
+        poll_loop()
 
 
 if __name__ == "__main__":